@@ -2,9 +2,35 @@
 Exports connector classes for CSV, Excel, and JSON.
 """
 
+import os
+
 from .connectors import (
     DataConnector,
     CSVConnector,
     JSONConnector,
     ExcelConnector,
-)
\ No newline at end of file
+    pa as _pa,
+)
+
+
+def _fit_arrow_cpu_pool() -> None:
+    """
+    pyarrow sizes its shared CPU pool (used by the CSV reader) to every CPU
+    on the machine. When this process is pinned to fewer, e.g. in a
+    container, shrink the pool to those. The pool is process-wide, so leave
+    it alone if it was configured through ARROW_NUM_THREADS/OMP_NUM_THREADS
+    or no longer has its startup size (the application called
+    pa.set_cpu_count itself).
+    """
+    if _pa is None or not hasattr(os, "sched_getaffinity"):
+        return
+    if "ARROW_NUM_THREADS" in os.environ or "OMP_NUM_THREADS" in os.environ:
+        return
+    if _pa.cpu_count() != os.cpu_count():
+        return
+    allowed = len(os.sched_getaffinity(0))
+    if allowed < _pa.cpu_count():
+        _pa.set_cpu_count(allowed)
+
+
+_fit_arrow_cpu_pool()
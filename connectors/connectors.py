@@ -3,15 +3,164 @@ Defines the DataConnector interface and implementations for CSV, Excel, and JSON
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, List
+import codecs
+import functools
+import importlib.util
 import json
+import mmap
+import os
+import queue
+import threading
 
+import numpy as np
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+
+try:  # optional: streaming xlsx reads without pandas' full workbook load
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:  # optional: SIMD-accelerated JSON parsing
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: simdjson for very large JSON documents
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:  # optional: multi-threaded CSV parsing
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# Rust-backed Excel reader, used by pandas as engine="calamine"
+_HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+
+# Suffixes pandas hands to openpyxl when no engine is given
+_OPENPYXL_SUFFIXES = (".xlsx", ".xlsm", ".xltx", ".xltm")
+
+# Documents at least this large are parsed with simdjson rather than orjson
+_SIMDJSON_MIN_BYTES = 1 << 26
+
+# Per-thread simdjson parser, reused so its internal buffers are allocated once
+_SIMDJSON = threading.local()
+
+# Raw read size when scanning JSONL for newlines
+_JSONL_READ_SIZE = 1 << 18
+
+# JSONL records buffered before being flushed to an Arrow table
+_JSONL_BATCH_ROWS = 65536
+
+# Block size handed to the pyarrow CSV reader; each block is parsed on its own thread.
+_CSV_BLOCK_SIZE = 1 << 24
+
+# Bytes sampled from the head of a file to estimate the average row width.
+_CSV_SAMPLE_BYTES = 1 << 16
+
+# Smallest streaming block; a single row must never straddle more than one block.
+_CSV_MIN_BLOCK_SIZE = 1 << 16
+
+# Compressed CSV suffixes pyarrow can decompress while it parses
+_CSV_COMPRESSION = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".zstd": "zstd"}
+
+# Compressed suffixes pandas infers but pyarrow cannot stream (archives, xz)
+_PANDAS_ONLY_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".zip", ".xz")
+
+# read_csv keyword arguments the pyarrow fast path knows how to translate.
+_PYARROW_CSV_KWARGS = frozenset({"usecols", "names", "skiprows", "quotechar"})
+
+# load() results, most recently used last, keyed on file identity and settings
+_LOAD_CACHE = OrderedDict()
+_LOAD_CACHE_SIZE = 32
+_LOAD_CACHE_LOCK = threading.Lock()
+
+# Larger files are never cached, so the cache can't pin big frames in memory
+_LOAD_CACHE_MAX_BYTES = 1 << 26
+
+
+def _cached_load(load):
+    """
+    Wrap a connector's `load` so that, for connectors built with
+    `cache=True`, reloading an unchanged small local file skips parsing.
+    Entries are keyed on the file's path, mtime and size plus the
+    connector's settings; every caller gets its own copy.
+    """
+    @functools.wraps(load)
+    def wrapper(self) -> pd.DataFrame:
+        path = _local_path(self.filepath) if self.cache else None
+        if path is None:
+            return load(self)  # buffers, URLs, missing files: nothing to key on
+        settings = _settings_key(self)
+        if settings is None:
+            return load(self)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return load(self)  # let the reader raise its usual error
+        if st.st_size > _LOAD_CACHE_MAX_BYTES:
+            return load(self)
+
+        key = (type(self), os.path.abspath(path), st.st_mtime_ns, st.st_size, settings)
+        with _LOAD_CACHE_LOCK:
+            df = _LOAD_CACHE.get(key)
+            if df is not None:
+                _LOAD_CACHE.move_to_end(key)
+        if df is None:
+            df = load(self)
+            with _LOAD_CACHE_LOCK:
+                _LOAD_CACHE[key] = df
+                while len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+                    _LOAD_CACHE.popitem(last=False)
+        # Arrow-backed columns are immutable, so this copy shares their data
+        return df.copy()
+
+    return wrapper
+
+
+def _settings_key(connector) -> Optional[tuple]:
+    """
+    Hashable snapshot of the connector's public attributes (its constructor
+    settings), or None if one of them can't be compared by value, e.g. a
+    callable or an array.
+    """
+    try:
+        return tuple(sorted(
+            (name, _freeze(value)) for name, value in vars(connector).items()
+            if not name.startswith("_")
+        ))
+    except TypeError:
+        return None
+
+
+def _freeze(value):
+    if value is None or isinstance(value, (str, bytes, int, float, np.generic)):
+        return (type(value), value)  # keeps 1, 1.0 and True apart
+    if isinstance(value, (type, np.dtype, pd.api.extensions.ExtensionDtype)):
+        return value
+    if isinstance(value, os.PathLike):
+        return (os.PathLike, os.fspath(value))
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    raise TypeError(f"cannot key the load cache on {type(value).__name__}")
+
 
 class DataConnector(ABC):
     """
     Abstract base class for data connectors.
     All connectors must implement `load()`, and may override `load_in_chunks()`.
+
+    Connectors built with `cache=True` keep the parsed result of small local
+    files and return a copy of it while the file is unchanged.
     """
 
     @abstractmethod
@@ -29,11 +178,82 @@ class DataConnector(ABC):
         df = self.load()
         yield df
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget all cached `load()` results.
+        """
+        with _LOAD_CACHE_LOCK:
+            _LOAD_CACHE.clear()
+
+    def load_in_chunks_prefetch(
+        self, chunk_size: int, prefetch: int = 2
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the same chunks as `load_in_chunks`, reading up to `prefetch`
+        chunks ahead on a background thread so that I/O and parsing overlap
+        with the caller's work on the current chunk.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+
+        chunks = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def produce():
+            source = self.load_in_chunks(chunk_size)
+            try:
+                for chunk in source:
+                    if not _put_unless_stopped(chunks, chunk, stop):
+                        return
+                _put_unless_stopped(chunks, _END_OF_CHUNKS, stop)
+            except Exception as exc:
+                _put_unless_stopped(chunks, exc, stop)
+            finally:
+                source.close()
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is _END_OF_CHUNKS:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # unblocks the producer if the caller stopped early
+            stop.set()
+            worker.join()
+
+
+# Marks the end of a prefetched chunk stream
+_END_OF_CHUNKS = object()
+
+
+def _put_unless_stopped(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """
+    Put `item` on a bounded queue, giving up once `stop` is set.
+    """
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
 
 class CSVConnector(DataConnector):
     """
     Connector for CSV files.
-    Uses pandas.read_csv under the hood and supports chunked reads.
+    Uses pyarrow's multi-threaded CSV reader when available (engine=None or
+    "pyarrow"), falling back to pandas.read_csv, and supports chunked reads.
+
+    For files with a known schema, pass `dtypes` (column -> dtype, e.g. the
+    `df.dtypes` of a first load) to skip type inference on later loads.
+    pandas' own `dtype=` keyword is accepted as an alias.
     """
 
     def __init__(
@@ -42,39 +262,353 @@ class CSVConnector(DataConnector):
         delimiter: str = ",",
         encoding: str = "utf-8",
         parse_dates: Optional[List[str]] = None,
+        engine: Optional[str] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        cache: bool = False,
         **read_csv_kwargs
     ):
         self.filepath = filepath
         self.delimiter = delimiter
         self.encoding = encoding
         self.parse_dates = parse_dates
+        self.engine = engine
+        if "dtype" in read_csv_kwargs:
+            if dtypes is not None:
+                raise TypeError("pass either 'dtypes' or 'dtype', not both")
+            dtypes = read_csv_kwargs.pop("dtype")
+        if hasattr(dtypes, "items"):
+            dtypes = dict(dtypes)  # e.g. a df.dtypes Series
+        self.dtypes = dtypes
         self.read_csv_kwargs = read_csv_kwargs
+        self.cache = cache
+        path = _local_path(filepath) or ""
+        self._compression = _CSV_COMPRESSION.get(os.path.splitext(path)[1].lower())
 
+    @_cached_load
     def load(self) -> pd.DataFrame:
+        if self._use_pyarrow():
+            try:
+                table = self._read_arrow()
+                text_columns = _inferred_temporal(table.schema, self._column_types())
+                if text_columns:
+                    # pandas keeps these as text; re-read them verbatim
+                    table = self._read_arrow(text_columns)
+            except pa.ArrowInvalid:
+                # e.g. non-ISO dates in parse_dates; let pandas have a go
+                pass
+            else:
+                return table.to_pandas(
+                    self_destruct=True,
+                    split_blocks=True,
+                    types_mapper=pd.ArrowDtype,
+                )
         return pd.read_csv(
             self.filepath,
             sep=self.delimiter,
             encoding=self.encoding,
             parse_dates=self.parse_dates,
-            **self.read_csv_kwargs
+            dtype=self.dtypes,
+            engine=self.engine,
+            **_backend_kwargs(self.read_csv_kwargs)
+        )
+
+    def _read_arrow(self, text_columns=()) -> "pa.Table":
+        with self._open_source() as source:
+            return pa_csv.read_csv(
+                source,
+                read_options=self._read_options(),
+                parse_options=self._parse_options(),
+                convert_options=self._convert_options(text_columns),
+            )
+
+    def _use_pyarrow(self) -> bool:
+        """
+        True if the pyarrow reader is selected and can honour every option.
+        """
+        if pa_csv is None or self.engine not in (None, "pyarrow"):
+            return False
+        if not isinstance(self.delimiter, str) or len(self.delimiter) != 1:
+            return False  # sniffing, multi-character and regex separators
+        path = _local_path(self.filepath)
+        if path is None or self._arrow_encoding() is None:
+            return False  # buffers, URLs, unknown encodings: pandas handles these
+        if path.lower().endswith(_PANDAS_ONLY_SUFFIXES):
+            return False
+        if self._compression and not pa.Codec.is_available(self._compression):
+            return False
+        if not set(self.read_csv_kwargs) <= _PYARROW_CSV_KWARGS:
+            return False
+        if not isinstance(self.read_csv_kwargs.get("skiprows", 0), int):
+            return False
+        for option in ("usecols", "names"):
+            # pyarrow selects and names columns by string label only
+            labels = self.read_csv_kwargs.get(option)
+            if labels is not None and not _all_strings(labels):
+                return False
+        if self.parse_dates is not None and not _all_strings(self.parse_dates):
+            return False
+        return self._column_types() is not None
+
+    def _column_types(self) -> Optional[dict]:
+        """
+        Arrow column types from parse_dates and dtypes, or None if some
+        dtype has no Arrow equivalent.
+        """
+        column_types = {}
+        if self.parse_dates is not None:
+            column_types.update((col, pa.timestamp("ns")) for col in self.parse_dates)
+        if self.dtypes is None:
+            return column_types
+        if not isinstance(self.dtypes, dict):
+            return None  # a single dtype for every column; leave it to pandas
+        for col, dtype in self.dtypes.items():
+            arrow_type = _arrow_type(dtype)
+            if not isinstance(col, str) or arrow_type is None:
+                return None
+            column_types[col] = arrow_type
+        return column_types
+
+    def _open_source(self) -> "pa.NativeFile":
+        """
+        Memory-map the file so pyarrow parses straight from the page cache,
+        or stream it through a decompressor for .gz/.bz2/.zst inputs.
+        """
+        path = _local_path(self.filepath)
+        if self._compression:
+            return pa.CompressedInputStream(pa.OSFile(path, "rb"), self._compression)
+        return pa.memory_map(path, "r")
+
+    def _arrow_encoding(self) -> Optional[str]:
+        """
+        The encoding name to hand pyarrow, or None if it isn't a known codec.
+        """
+        if not isinstance(self.encoding, str):
+            return None
+        try:
+            name = codecs.lookup(self.encoding).name
+        except LookupError:
+            return None
+        # pyarrow only skips transcoding for the exact name "utf8"
+        return "utf8" if name == "utf-8" else self.encoding
+
+    def _read_options(self, block_size: int = _CSV_BLOCK_SIZE) -> "pa_csv.ReadOptions":
+        return pa_csv.ReadOptions(
+            block_size=block_size,
+            encoding=self._arrow_encoding(),
+            skip_rows=self.read_csv_kwargs.get("skiprows", 0),
+            column_names=self.read_csv_kwargs.get("names"),
+        )
+
+    def _parse_options(self) -> "pa_csv.ParseOptions":
+        return pa_csv.ParseOptions(
+            delimiter=self.delimiter,
+            quote_char=self.read_csv_kwargs.get("quotechar", '"'),
+        )
+
+    def _convert_options(self, text_columns=()) -> "pa_csv.ConvertOptions":
+        column_types = self._column_types()
+        column_types.update((col, pa.string()) for col in text_columns)
+        return pa_csv.ConvertOptions(
+            column_types=column_types,
+            timestamp_parsers=[pa_csv.ISO8601],
+            strings_can_be_null=True,  # empty fields are NaN in pandas too
+            include_columns=self.read_csv_kwargs.get("usecols"),
         )
 
     def load_in_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
-        for chunk in pd.read_csv(
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("'chunk_size' must be an integer >=1")
+
+        yielded = 0
+        if self._use_pyarrow():
+            chunks = self._iter_arrow_chunks(chunk_size)
+            try:
+                while True:
+                    try:
+                        chunk = next(chunks)
+                    except StopIteration:
+                        return
+                    except pa.ArrowInvalid:
+                        # e.g. a column type changing after the first block, or
+                        # non-ISO parse_dates; pandas picks up where we stopped
+                        break
+                    yield chunk
+                    yielded += len(chunk)
+            finally:
+                chunks.close()
+
+        with pd.read_csv(
             self.filepath,
             sep=self.delimiter,
             encoding=self.encoding,
             parse_dates=self.parse_dates,
+            dtype=self.dtypes,
+            engine=None if self.engine == "pyarrow" else self.engine,
             chunksize=chunk_size,
-            **self.read_csv_kwargs
-        ):
-            yield chunk
+            **_backend_kwargs(self.read_csv_kwargs)
+        ) as reader:
+            # Skip what pyarrow already yielded by record count: skiprows sees
+            # raw line numbers, which drift on blank lines and quoted newlines
+            while yielded:
+                try:
+                    yielded -= len(reader.get_chunk(min(yielded, chunk_size)))
+                except StopIteration:
+                    return
+            yield from reader
+
+    def _iter_arrow_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        block_size = self._chunk_block_size(chunk_size)
+        with self._open_source() as source:
+            reader = self._open_arrow_reader(source, block_size)
+            text_columns = _inferred_temporal(reader.schema, self._column_types())
+            if not text_columns:
+                yield from _arrow_chunks(reader, chunk_size)
+                return
+        # the schema comes from the first block alone, so re-opening is cheap
+        with self._open_source() as source:
+            reader = self._open_arrow_reader(source, block_size, text_columns)
+            yield from _arrow_chunks(reader, chunk_size)
+
+    def _open_arrow_reader(self, source, block_size: int, text_columns=()):
+        # blocks are read and parsed on a background thread while we convert
+        return pa_csv.open_csv(
+            source,
+            read_options=self._read_options(block_size),
+            parse_options=self._parse_options(),
+            convert_options=self._convert_options(text_columns),
+        )
+
+    def _chunk_block_size(self, chunk_size: int) -> int:
+        """
+        Size streaming blocks to hold roughly `chunk_size` rows, based on
+        the average row width at the head of the (decompressed) file.
+        """
+        with self._open_source() as source:
+            sample = source.read(_CSV_SAMPLE_BYTES)
+        row_bytes = -(-len(sample) // max(sample.count(b"\n"), 1))
+        # _rebatch cuts exact chunks, so blocks needn't grow past the default
+        # (pyarrow's block_size is an int32)
+        return min(max(chunk_size * row_bytes, _CSV_MIN_BLOCK_SIZE), _CSV_BLOCK_SIZE)
+
+
+def _local_path(filepath) -> Optional[str]:
+    """
+    The path of an existing local file behind `filepath`, or None for
+    buffers, URLs and anything else only pandas knows how to open.
+    """
+    if not isinstance(filepath, (str, os.PathLike)):
+        return None
+    path = os.fspath(filepath)
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return None
+    return path
+
+
+def _arrow_chunks(reader, chunk_size: int) -> Iterator[pd.DataFrame]:
+    start = 0
+    for table in _rebatch(reader, chunk_size):
+        chunk = table.to_pandas(types_mapper=pd.ArrowDtype)
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def _inferred_temporal(schema: "pa.Schema", column_types: dict) -> list:
+    """
+    Columns pyarrow typed as dates, times or timestamps on its own. pandas
+    only parses the columns listed in parse_dates, so these stay text.
+    """
+    return [
+        field.name for field in schema
+        if field.name not in column_types and pa.types.is_temporal(field.type)
+    ]
+
+
+def _all_strings(labels) -> bool:
+    return isinstance(labels, (list, tuple)) and all(
+        isinstance(label, str) for label in labels
+    )
+
+
+def _backend_kwargs(kwargs: dict) -> dict:
+    """
+    Ask a pandas reader for Arrow-backed columns when pyarrow is installed,
+    unless the caller picked a dtype_backend.
+    """
+    if pa is None or "dtype_backend" in kwargs:
+        return kwargs
+    return {"dtype_backend": "pyarrow", **kwargs}
+
+
+def _to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a NumPy-backed frame to Arrow-backed columns, if pyarrow is
+    installed. Floats stay floats; object columns Arrow can't type stay object.
+    """
+    if pa is None:
+        return df
+    try:
+        return _convert_dtypes(df)
+    except (TypeError, OverflowError, pa.ArrowInvalid):
+        pass
+    # some column holds values Arrow can't type (e.g. ints past uint64);
+    # convert the others one by one and leave it as object
+    df = df.copy()
+    for i in range(df.shape[1]):
+        try:
+            df.isetitem(i, _convert_dtypes(df.iloc[:, i]))
+        except (TypeError, OverflowError, pa.ArrowInvalid):
+            pass
+    return df
+
+
+def _convert_dtypes(data):
+    # a single pass would also turn integral floats into ints; the first pass
+    # moves floats to Arrow as floats, the second picks up NumPy int columns
+    data = data.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+    return data.convert_dtypes(dtype_backend="pyarrow")
+
+
+def _arrow_type(dtype) -> Optional["pa.DataType"]:
+    """
+    Translate a pandas dtype spec to an Arrow type, or None if there is no
+    direct equivalent (object, category, ...).
+    """
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    dtype = getattr(dtype, "numpy_dtype", dtype)  # nullable Int64, boolean, ...
+    try:
+        return pa.from_numpy_dtype(dtype)
+    except (TypeError, NotImplementedError):
+        return None
+
+
+def _rebatch(batches: Iterator["pa.RecordBatch"], size: int) -> Iterator["pa.Table"]:
+    """
+    Regroup a stream of Arrow record batches into tables of exactly `size`
+    rows (the last one may be shorter). Slicing is zero-copy.
+    """
+    pending, pending_rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, size)
+            rest = table.slice(size)
+            pending, pending_rows = rest.to_batches(), rest.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending)
 
 
 class ExcelConnector(DataConnector):
     """
     Connector for Excel files.
     Reads one or all sheets, then drops any "Unnamed:" columns by default.
+    Defaults to the calamine engine when python-calamine is installed.
     """
 
     def __init__(
@@ -83,35 +617,207 @@ class ExcelConnector(DataConnector):
         sheet_name: Optional[str] = 0,
         engine: Optional[str] = None,
         drop_unnamed: bool = True,
+        cache: bool = False,
         **read_excel_kwargs
     ):
+        if engine is None and _HAS_CALAMINE:
+            engine = "calamine"
+
         self.filepath = filepath
         self.sheet_name = sheet_name
         self.engine = engine
         self.drop_unnamed = drop_unnamed
         self.read_excel_kwargs = read_excel_kwargs
+        self.cache = cache
+
+        # pick the code path once: several sheets come back as a dict to concat
+        if sheet_name is None or isinstance(sheet_name, list):
+            self._load_impl = self._load_multi
+        else:
+            self._load_impl = self._load_single
 
+    @_cached_load
     def load(self) -> pd.DataFrame:
-        df = pd.read_excel(
+        return self._load_impl()
+
+    def _load_single(self) -> pd.DataFrame:
+        if self._use_read_only():
+            df = self._read_openpyxl()
+        else:
+            df = self._read_sheet(self.sheet_name)
+        return self._drop_unnamed(df)
+
+    def _load_multi(self) -> pd.DataFrame:
+        if self._use_read_only():
+            sheets = self._read_openpyxl()
+        elif self.engine == "calamine":
+            sheets = self._read_sheets_parallel()
+        else:
+            sheets = self._read_sheet(self.sheet_name)
+
+        # Concatenate first so the Unnamed mask is computed once
+        return self._drop_unnamed(_concat_sheets(list(sheets.values())))
+
+    def _drop_unnamed(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.drop_unnamed:
+            # keep only string-named columns that don't start with "Unnamed"
+            df = df.loc[:, _named_columns(df.columns)]
+        return df
+
+    def _read_sheets_parallel(self) -> dict:
+        """
+        Read several sheets concurrently; calamine parses outside the GIL.
+        Each worker opens its own handle as calamine workbooks are not
+        safe to share between threads.
+        """
+        if self.sheet_name is None:
+            with pd.ExcelFile(self.filepath, engine=self.engine) as xl:
+                names = xl.sheet_names
+        else:
+            names = self.sheet_name
+
+        workers = max(1, min(len(names), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(names, pool.map(self._read_sheet, names)))
+
+    def _read_sheet(self, sheet):
+        return pd.read_excel(
             self.filepath,
-            sheet_name=self.sheet_name,
+            sheet_name=sheet,
             engine=self.engine,
-            **self.read_excel_kwargs
+            **_backend_kwargs(self.read_excel_kwargs)
         )
 
-        # If multiple sheets requested, concatenate them
-        if isinstance(df, dict):
-            df = pd.concat(df.values(), ignore_index=True)
+    def _use_read_only(self) -> bool:
+        """
+        True if openpyxl would be used and can be driven directly.
+        """
+        if openpyxl is None or self.read_excel_kwargs:
+            return False
+        if self.engine is None:
+            return str(self.filepath).lower().endswith(_OPENPYXL_SUFFIXES)
+        return self.engine == "openpyxl"
 
-        if self.drop_unnamed:
-            # keep only string-named columns that don't start with "Unnamed"
-            df = df.loc[
-                :,
-                [col for col in df.columns
-                 if isinstance(col, str) and not col.startswith("Unnamed")]
-            ]
+    def _read_openpyxl(self):
+        """
+        Mirror pd.read_excel's return shape using openpyxl's read-only mode,
+        which streams rows instead of building styled Cell objects.
+        """
+        wb = openpyxl.load_workbook(self.filepath, read_only=True, data_only=True)
+        try:
+            if self.sheet_name is None:
+                names = wb.sheetnames
+            elif isinstance(self.sheet_name, list):
+                names = self.sheet_name
+            else:
+                return _sheet_to_frame(_get_sheet(wb, self.sheet_name))
+            return {name: _sheet_to_frame(_get_sheet(wb, name)) for name in names}
+        finally:
+            wb.close()
 
-        return df
+
+def _named_columns(columns: pd.Index) -> np.ndarray:
+    """
+    Boolean mask of column labels that are strings not starting with
+    "Unnamed", computed with vectorised string ops on the Index.
+    """
+    if isinstance(columns, pd.MultiIndex):
+        return np.zeros(len(columns), dtype=bool)  # tuple labels are never str
+    mask = ~np.asarray(columns.astype(str).str.startswith("Unnamed"), dtype=bool)
+    mask &= ~np.asarray(columns.isna())
+    if columns.inferred_type != "string":
+        # mixed labels: only here do we need a per-label type check
+        mask &= np.asarray(columns.map(lambda col: isinstance(col, str)), dtype=bool)
+    return mask
+
+
+def _concat_sheets(frames: list) -> pd.DataFrame:
+    """
+    Stack per-sheet frames. Arrow-backed columns are joined by appending
+    chunks to a ChunkedArray, so no column data is copied; a lone sheet is
+    returned as is.
+    """
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _get_sheet(wb, sheet):
+    """
+    Look up a worksheet by position or name, as pandas does.
+    """
+    if isinstance(sheet, int):
+        if sheet >= len(wb.worksheets):
+            raise ValueError(
+                f"Worksheet index {sheet} is invalid, "
+                f"{len(wb.worksheets)} worksheets found"
+            )
+        return wb.worksheets[sheet]
+    if sheet not in wb.sheetnames:
+        raise ValueError(f"Worksheet named '{sheet}' not found")
+    return wb[sheet]
+
+
+def _sheet_to_frame(ws) -> pd.DataFrame:
+    """
+    Build a DataFrame from a read-only worksheet the way pd.read_excel
+    would: the first row is the header, blank header cells become
+    "Unnamed: <i>", duplicate names are mangled ("a", "a.1") and pandas'
+    default NA strings ("", "NA", "null", ...) become missing values.
+    """
+    ws.reset_dimensions()  # stored dimensions are often wrong
+    rows = list(ws.iter_rows(values_only=True))
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+
+    width = max(len(row) for row in rows)
+    header = list(rows[0]) + [None] * (width - len(rows[0]))
+    columns = _dedup_names([
+        f"Unnamed: {i}" if name is None else name
+        for i, name in enumerate(header)
+    ])
+    data = [
+        [None if isinstance(value, str) and value in STR_NA_VALUES else value
+         for value in row] + [None] * (width - len(row))
+        for row in rows[1:]
+    ]
+    if pa is None or not data:
+        return _to_arrow_backed(pd.DataFrame.from_records(data, columns=columns))
+    return pd.DataFrame(
+        dict(zip(columns, map(_sheet_column, zip(*data)))), columns=columns
+    )
+
+
+def _sheet_column(values: tuple):
+    """
+    Type one column with Arrow, so that ints with blank cells stay int64 as
+    in pd.read_excel(dtype_backend="pyarrow"); mixed columns stay object.
+    """
+    try:
+        return pd.arrays.ArrowExtensionArray(pa.array(values))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return np.array(values, dtype=object)
+
+
+def _dedup_names(names: list) -> list:
+    """
+    Rename repeated column labels to "name.1", "name.2", ... skipping any
+    label present elsewhere in the header, as pandas' parsers do.
+    """
+    names = list(names)
+    counts = {}
+    for i, name in enumerate(names):
+        base = name
+        count = counts.get(base, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
 
 
 class JSONConnector(DataConnector):
@@ -119,6 +825,14 @@ class JSONConnector(DataConnector):
     Connector for JSON files.
     Supports both in-memory JSON arrays and line-delimited JSON.
     Flattens nested structures via pandas.json_normalize.
+
+    Line-delimited JSON is streamed through Arrow and keeps field values as
+    written: unlike pandas.read_json, date-like columns ("date", "*_at",
+    "timestamp*", ...) are not converted to datetimes, and numeric-looking
+    strings such as {"zip": "08075"} stay strings rather than becoming 8075.
+    Passing any read_json option, e.g. `convert_dates=True`, reads through
+    pandas instead; that read is Arrow-backed too, so strings still aren't
+    coerced to numbers.
     """
 
     def __init__(
@@ -126,24 +840,229 @@ class JSONConnector(DataConnector):
         filepath: str,
         orient: str = "records",
         lines: bool = False,
+        cache: bool = False,
         **json_kwargs
     ):
         self.filepath = filepath
         self.orient = orient
         self.lines = lines
         self.json_kwargs = json_kwargs
+        self.cache = cache
 
+    @_cached_load
     def load(self) -> pd.DataFrame:
         if self.lines:
             # line-delimited JSON (JSONL)
+            if self._use_arrow_lines():
+                try:
+                    return self._read_jsonl().to_pandas(
+                        self_destruct=True, types_mapper=pd.ArrowDtype
+                    )
+                except (TypeError, OverflowError, pa.ArrowInvalid):
+                    # mixed-type fields or ints beyond int64/uint64 ranges;
+                    # pandas keeps them as object
+                    pass
             return pd.read_json(
                 self.filepath,
                 orient=self.orient,
                 lines=True,
-                **self.json_kwargs
+                **_backend_kwargs(self.json_kwargs)
             )
         # load full JSON document
-        with open(self.filepath, "r", encoding="utf-8") as f:
-            obj = json.load(f)
-        return pd.json_normalize(obj, **self.json_kwargs)
+        obj = _parse_json_file(self.filepath)
+        records = None if self.json_kwargs else _flat_records(obj)
+        if records is not None:
+            # nothing to flatten; skip json_normalize's recursive walk
+            return _records_to_frame(records)
+        return _to_arrow_backed(pd.json_normalize(obj, **self.json_kwargs))
+
+    def load_in_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        if not self.lines:
+            yield from super().load_in_chunks(chunk_size)
+            return
+
+        if not self._use_arrow_lines():
+            with pd.read_json(
+                self.filepath,
+                orient=self.orient,
+                lines=True,
+                chunksize=chunk_size,
+                **_backend_kwargs(self.json_kwargs)
+            ) as reader:
+                yield from reader
+            return
+
+        start = 0
+        for batch in self._iter_record_batches(chunk_size):
+            chunk = _records_to_frame(batch)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+    def _use_arrow_lines(self) -> bool:
+        """
+        True if JSONL can be streamed into Arrow without pandas-only options.
+        """
+        return pa is not None and self.orient == "records" and not self.json_kwargs
+
+    def _read_jsonl(self) -> "pa.Table":
+        """
+        Parse JSONL line by line, flushing every `_JSONL_BATCH_ROWS` records
+        to an Arrow table so only one batch of Python objects is alive.
+        """
+        tables = [
+            _records_to_table(batch)
+            for batch in self._iter_record_batches(_JSONL_BATCH_ROWS)
+        ]
+        if not tables:
+            return pa.table({})
+        return pa.concat_tables(tables, promote_options="permissive")
+
+    def _iter_record_batches(self, size: int) -> Iterator[list]:
+        """
+        Yield lists of up to `size` parsed JSONL records.
+        """
+        batch = []
+        for record in _iter_jsonl_records(self.filepath):
+            batch.append(record)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _parse_json(buf: bytes):
+    """
+    Parse a JSON document with the fastest parser available, falling back
+    to the stdlib for what the strict parsers reject (NaN, Infinity).
+    """
+    try:
+        if simdjson is not None and len(buf) >= _SIMDJSON_MIN_BYTES:
+            # recursive=True materialises plain dicts/lists, so no proxy
+            # objects outlive the call and pin the reused parser
+            return _get_simdjson_parser().parse(buf, True)
+        if orjson is not None:
+            return orjson.loads(buf)
+    except ValueError:
+        pass  # json.loads raises its own error if the input is really invalid
+    return json.loads(bytes(buf))
+
+
+def _parse_json_file(path):
+    """
+    Parse a JSON document from a read-only mmap of the file, so the parser
+    reads the page cache directly instead of a full in-memory copy.
+    """
+    with open(path, "rb") as f:
+        _advise_sequential(f.fileno())
+        if os.fstat(f.fileno()).st_size == 0:
+            return _parse_json(b"")  # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _parse_json(view)
 
+
+def _advise_sequential(fd: int) -> None:
+    # tell the kernel to read ahead aggressively, where supported
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _get_simdjson_parser() -> "simdjson.Parser":
+    """
+    Return this thread's simdjson parser, creating it on first use.
+    A parser must not be shared between threads.
+    """
+    parser = getattr(_SIMDJSON, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON.parser = simdjson.Parser()
+    return parser
+
+
+def _iter_jsonl_records(path) -> Iterator:
+    """
+    Yield parsed records from a JSONL file. Reads raw 256 KiB blocks and
+    splits them on newlines with bytes.split (memchr), rather than going
+    through the buffered line iterator. Blocks without a newline are only
+    collected, so a long record is joined once instead of being rescanned
+    on every read.
+    """
+    pending = []
+    with open(path, "rb", buffering=0) as f:
+        _advise_sequential(f.fileno())
+        while True:
+            block = f.read(_JSONL_READ_SIZE)
+            if not block:
+                break
+            if b"\n" not in block:
+                pending.append(block)
+                continue
+            if pending:
+                pending.append(block)
+                block = b"".join(pending)
+            lines = block.split(b"\n")
+            tail = lines.pop()
+            pending = [tail] if tail else []
+            for line in lines:
+                if not _is_blank(line):
+                    yield _parse_json(line)
+    tail = b"".join(pending)
+    if not _is_blank(tail):
+        yield _parse_json(tail)
+
+
+def _is_blank(line: bytes) -> bool:
+    # only lines that begin with whitespace need the (copying) strip
+    return not line or (line[0] in b" \t\r" and not line.strip())
+
+
+def _flat_records(obj) -> Optional[list]:
+    """
+    The records of a JSON document with nothing to normalise (a flat object
+    or a non-empty list of flat objects), or None.
+    """
+    if _is_flat_object(obj):
+        return [obj]
+    if isinstance(obj, list) and obj and all(_is_flat_object(item) for item in obj):
+        return obj
+    return None
+
+
+def _is_flat_object(obj) -> bool:
+    return isinstance(obj, dict) and not any(
+        isinstance(value, (dict, list)) for value in obj.values()
+    )
+
+
+def _records_to_frame(records: list) -> pd.DataFrame:
+    """
+    Build a DataFrame from JSON records, through Arrow when every field has
+    a single type.
+    """
+    if pa is not None:
+        try:
+            return _records_to_table(records).to_pandas(
+                self_destruct=True, types_mapper=pd.ArrowDtype
+            )
+        except (TypeError, OverflowError, pa.ArrowInvalid):
+            # mixed-type fields or ints beyond int64/uint64 ranges;
+            # pandas keeps them as object
+            pass
+    return _to_arrow_backed(pd.DataFrame(records))
+
+
+def _records_to_table(records: list) -> "pa.Table":
+    """
+    Build an Arrow table from JSON records. Unlike pa.Table.from_pylist,
+    which takes its columns from the first record, every key seen in the
+    batch becomes a column.
+    """
+    if not all(isinstance(record, dict) for record in records):
+        raise TypeError("JSONL records must be objects")
+    columns = dict.fromkeys(key for record in records for key in record)
+    if not columns:
+        # a table built from no columns has no rows; keep one per record
+        empty = pa.array(records, type=pa.struct([]))
+        return pa.Table.from_batches([pa.RecordBatch.from_struct_array(empty)])
+    return pa.table({key: [record.get(key) for record in records] for key in columns})
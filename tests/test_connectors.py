@@ -2,6 +2,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import io
 import json
 import pytest
 from pathlib import Path
@@ -23,6 +24,203 @@ def test_addresses_csv():
     assert total_rows == df.shape[0]
 
 
+def test_csv_pyarrow_matches_pandas_engine():
+    pytest.importorskip("pyarrow")
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    fast = CSVConnector(file_path, engine="pyarrow").load()
+    slow = CSVConnector(file_path, engine="c").load()
+
+    assert list(fast.columns) == list(slow.columns)
+    assert fast.astype(str).equals(slow.astype(str))
+
+
+def test_csv_pyarrow_keeps_unparsed_date_columns_as_text(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / 'dates.csv'
+    file_path.write_text(
+        "id,d,t,ts,when\n"
+        "1,2020-01-02,12:34:56,2021-01-02 03:04,2020-01-02\n"
+        "2,2021-03-04,01:02:03,2021-01-02T03:04:05Z,2020-01-03\n"
+    )
+    kwargs = {'parse_dates': ['when']}
+    fast = CSVConnector(file_path, engine="pyarrow", **kwargs)
+    slow = CSVConnector(file_path, engine="c", **kwargs)
+
+    for got, expected in [(fast.load(), slow.load()),
+                          (next(fast.load_in_chunks(1)), next(slow.load_in_chunks(1)))]:
+        assert list(got.dtypes[:4]) == list(expected.dtypes[:4])
+        assert got['ts'].tolist() == expected['ts'].tolist()
+        assert pd.api.types.is_datetime64_any_dtype(got['when'])
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.ParserWarning")
+@pytest.mark.parametrize("sep, delimiter", [
+    (';;', ';;'),
+    ('; ', r';\s*'),
+    (';', None),
+])
+def test_csv_separators_pyarrow_cannot_take(tmp_path, sep, delimiter):
+    file_path = tmp_path / 'semi.csv'
+    file_path.write_text(f"d{sep}v\n2020-01-02{sep}1\n2020-01-03{sep}2\n")
+
+    df = CSVConnector(file_path, delimiter=delimiter).load()
+
+    assert list(df.columns) == ['d', 'v']
+    assert df['v'].tolist() == [1, 2]
+
+
+def test_csv_positional_parse_dates(tmp_path):
+    file_path = tmp_path / 'dates.csv'
+    file_path.write_text("d,v\n2020-01-02,1\n2020-01-03,2\n")
+
+    df = CSVConnector(file_path, parse_dates=[0]).load()
+
+    assert pd.api.types.is_datetime64_any_dtype(df['d'])
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'usecols': [0, 1]},
+    {'encoding': None},
+])
+def test_csv_options_pyarrow_cannot_take_fall_back(kwargs):
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    df = CSVConnector(file_path, **kwargs).load()
+
+    assert df.shape[0] == 5
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_csv_explicit_dtypes(engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    df = CSVConnector(file_path, engine=engine, dtypes={' 08075': 'float64'}).load()
+
+    assert df[' 08075'].dtype.kind == 'f'
+    assert df[' 08075'].tolist() == [9119.0, 8075.0, 91234.0, 298.0, 123.0]
+
+
+def test_csv_dtype_alias_and_dtypes_series():
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    first = CSVConnector(file_path, dtype={' 08075': 'float64'}).load()
+
+    assert first[' 08075'].dtype.kind == 'f'
+    again = CSVConnector(file_path, dtypes=first.dtypes).load()
+    assert list(again.dtypes) == list(first.dtypes)
+    with pytest.raises(TypeError, match="not both"):
+        CSVConnector(file_path, dtypes={}, dtype={})
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zip", ".tar.gz"])
+def test_csv_compressed_input(tmp_path, suffix):
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    compressed = tmp_path / ('addresses.csv' + suffix)
+    pd.read_csv(file_path).to_csv(compressed, index=False)
+
+    df = CSVConnector(compressed).load()
+
+    assert df.shape == (5, 6)
+    assert df.astype(str).equals(CSVConnector(file_path).load().astype(str))
+    assert sum(len(c) for c in CSVConnector(compressed).load_in_chunks(2)) == 5
+
+
+def test_csv_chunks_survive_type_change_after_first_block(tmp_path):
+    file_path = tmp_path / 'drift.csv'
+    rows = [str(i) for i in range(200_000)] + ['1.5', '7']
+    lines = [f'{v},x\n' for v in rows]
+    lines[10:10] = ['\n'] * 3  # pyarrow and pandas count these differently
+    file_path.write_text('a,b\n' + ''.join(lines))
+
+    chunks = list(CSVConnector(file_path).load_in_chunks(chunk_size=50_000))
+    df = pd.concat(chunks)
+
+    assert len(df) == len(rows)
+    assert df.index.equals(pd.RangeIndex(len(rows)))
+    assert df['a'].astype(float).tolist()[-3:] == [199_999.0, 1.5, 7.0]
+
+
+def test_csv_chunks_non_iso_dates(tmp_path):
+    file_path = tmp_path / 'dates.csv'
+    file_path.write_text('d,v\n01/02/2020,1\n03/04/2020,2\n')
+
+    chunks = list(
+        CSVConnector(file_path, parse_dates=['d']).load_in_chunks(chunk_size=1)
+    )
+
+    assert len(chunks) == 2
+    assert pd.api.types.is_datetime64_any_dtype(chunks[0]['d'])
+
+
+def test_csv_chunk_size_bounds():
+    conn = CSVConnector(TEST_DATA_DIR / 'addresses.csv')
+    with pytest.raises(ValueError):
+        next(conn.load_in_chunks(chunk_size=0))
+    # larger than any pyarrow block; must still come back as one chunk
+    assert len(list(conn.load_in_chunks(chunk_size=50_000_000))) == 1
+
+
+def test_csv_prefetched_chunks_match_chunks():
+    file_path = TEST_DATA_DIR / 'addresses.csv'
+    conn = CSVConnector(file_path)
+
+    prefetched = list(conn.load_in_chunks_prefetch(chunk_size=2, prefetch=1))
+    chunks = list(conn.load_in_chunks(chunk_size=2))
+
+    assert len(prefetched) == len(chunks) == 3
+    for got, expected in zip(prefetched, chunks):
+        assert got.equals(expected)
+
+    # stopping early must not leave the reader thread blocked
+    for _ in conn.load_in_chunks_prefetch(chunk_size=1, prefetch=1):
+        break
+
+
+def test_prefetch_reraises_reader_errors(tmp_path):
+    conn = CSVConnector(tmp_path / 'missing.csv')
+    with pytest.raises(FileNotFoundError):
+        list(conn.load_in_chunks_prefetch(chunk_size=2))
+
+
+def test_load_cache_tracks_file_changes(tmp_path):
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text("a,b\n1,x\n")
+    conn = CSVConnector(file_path, cache=True)
+
+    first = conn.load()
+    first.loc[0, 'a'] = 99
+    assert conn.load().loc[0, 'a'] == 1  # callers get independent copies
+
+    file_path.write_text("a,b\n1,x\n2,y\n")
+    assert conn.load().shape == (2, 2)
+
+    CSVConnector.clear_cache()
+    assert conn.load().shape == (2, 2)
+
+
+def test_load_cache_is_opt_in_and_keyed_on_values(tmp_path, monkeypatch):
+    import connectors.connectors as module
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text("a,b\n1,x\n2,y\n")
+    monkeypatch.setattr(module, '_LOAD_CACHE', module.OrderedDict())
+
+    CSVConnector(file_path).load()
+    CSVConnector(file_path, cache=True, skiprows=lambda i: i == 1).load()
+    assert len(module._LOAD_CACHE) == 0
+
+    CSVConnector(file_path, cache=True, usecols=['a']).load()
+    df = CSVConnector(file_path, cache=True, usecols=['b']).load()
+    assert len(module._LOAD_CACHE) == 2
+    assert list(df.columns) == ['b']
+
+
+def test_buffer_inputs_bypass_cache():
+    csv = io.StringIO((TEST_DATA_DIR / 'addresses.csv').read_text())
+    assert CSVConnector(csv, cache=True).load().shape == (5, 6)
+
+    xlsx = io.BytesIO((TEST_DATA_DIR / 'file_example_XLSX_10.xlsx').read_bytes())
+    assert ExcelConnector(xlsx, cache=True).load().shape == (9, 7)
+
+
 def test_excel_connector_example_file():
     file_path = TEST_DATA_DIR / 'file_example_XLSX_10.xlsx'
     conn = ExcelConnector(file_path)
@@ -35,6 +233,98 @@ def test_excel_connector_example_file():
         assert col in df.columns
 
 
+def test_excel_openpyxl_read_only_matches_default():
+    file_path = TEST_DATA_DIR / 'file_example_XLSX_10.xlsx'
+    df = ExcelConnector(file_path, engine="openpyxl").load()
+
+    assert df.shape == (9, 7)
+    expected = ExcelConnector(file_path).load()
+    assert list(df.dtypes) == list(expected.dtypes)
+    assert df.equals(expected)
+
+
+def test_excel_openpyxl_dtypes_match_pandas(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    file_path = tmp_path / 'gaps.xlsx'
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in (['i', 'f', 's'], [1, 1.5, 'x'], [None, 2.5, None], [3, None, 'z']):
+        ws.append(row)
+    wb.save(file_path)
+
+    df = ExcelConnector(file_path, engine="openpyxl").load()
+    expected = pd.read_excel(file_path, engine="openpyxl", dtype_backend="pyarrow")
+
+    assert list(df.dtypes) == list(expected.dtypes)
+    assert str(df['i'].dtype) == 'int64[pyarrow]'
+
+
+@pytest.mark.parametrize("sheet, message", [
+    (3, "Worksheet index 3 is invalid"),
+    ('missing', "Worksheet named 'missing' not found"),
+])
+def test_excel_openpyxl_bad_sheet_raises_like_pandas(sheet, message):
+    file_path = TEST_DATA_DIR / 'file_example_XLSX_10.xlsx'
+    with pytest.raises(ValueError, match=message):
+        pd.read_excel(file_path, sheet_name=sheet, engine="openpyxl")
+    with pytest.raises(ValueError, match=message):
+        ExcelConnector(file_path, sheet_name=sheet, engine="openpyxl").load()
+
+
+def test_excel_openpyxl_duplicate_headers_and_na_markers(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    file_path = tmp_path / 'messy.xlsx'
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in (['a', 'a', 'c', 'a.1'], [1, 'NA', 'x', 'y'], [2, 'z', '', 'null']):
+        ws.append(row)
+    wb.save(file_path)
+
+    df = ExcelConnector(file_path, engine="openpyxl").load()
+    expected = pd.read_excel(file_path, engine="openpyxl")
+
+    assert list(df.columns) == list(expected.columns) == ['a', 'a.2', 'c', 'a.1']
+    assert df.isna().equals(expected.isna())
+
+
+@pytest.mark.parametrize("columns", [
+    pd.Index(['a', 'Unnamed: 1', 'b']),
+    pd.Index(['a', 0, 'Unnamed: 2', 1.5, None]),
+    pd.Index(['a', float('nan'), 'Unnamed: 2']),
+    pd.MultiIndex.from_tuples([('a', 'x'), ('Unnamed: 1', 'y')]),
+])
+def test_excel_named_columns_matches_label_check(columns):
+    from connectors.connectors import _named_columns
+    expected = [isinstance(col, str) and not col.startswith("Unnamed") for col in columns]
+
+    assert _named_columns(columns).tolist() == expected
+
+
+def test_excel_multi_row_header(tmp_path):
+    file_path = tmp_path / 'header.xlsx'
+    pd.DataFrame([[1, 2], [3, 4]], columns=pd.MultiIndex.from_tuples(
+        [('a', 'x'), ('b', 'y')])).to_excel(file_path)
+
+    df = ExcelConnector(file_path, header=[0, 1]).load()
+
+    # tuple labels aren't strings, so drop_unnamed keeps none of them
+    assert df.shape == (len(pd.read_excel(file_path, header=[0, 1])), 0)
+
+
+def test_excel_all_sheets_concatenated(tmp_path):
+    file_path = tmp_path / 'multi.xlsx'
+    with pd.ExcelWriter(file_path) as writer:
+        for i in range(3):
+            pd.DataFrame({'a': [i, i], 'b': ['x', 'y']}).to_excel(
+                writer, sheet_name=f'sheet{i}', index=False
+            )
+
+    df = ExcelConnector(file_path, sheet_name=None).load()
+
+    assert df.shape == (6, 2)
+    assert df['a'].tolist() == [0, 0, 1, 1, 2, 2]
+
+
 def test_json_connector_simple():
     file_path = TEST_DATA_DIR / 'example_1.json'
     conn = JSONConnector(file_path)
@@ -49,6 +339,51 @@ def test_json_connector_simple():
     assert df.at[0, 'color'] == 'Red'
 
 
+def test_json_connector_flat_and_nested_arrays(tmp_path):
+    flat = tmp_path / 'flat.json'
+    flat.write_text(json.dumps([{'id': 1, 'name': 'a'}, {'id': 2, 'extra': True}]))
+    df = JSONConnector(flat).load()
+
+    assert df.shape == (2, 3)
+    assert list(df.columns) == ['id', 'name', 'extra']
+
+    nested = tmp_path / 'nested.json'
+    nested.write_text(json.dumps([{'id': 1, 'address': {'city': 'X'}}]))
+    df = JSONConnector(nested).load()
+
+    assert list(df.columns) == ['id', 'address.city']
+
+
+@pytest.mark.parametrize("obj, shape", [({}, (1, 0)), ([{}, {}], (2, 0))])
+def test_json_connector_records_without_keys(tmp_path, obj, shape):
+    file_path = tmp_path / 'empty.json'
+    file_path.write_text(json.dumps(obj))
+
+    assert JSONConnector(file_path).load().shape == shape
+    assert pd.json_normalize(obj).shape == shape
+
+
+def test_json_connector_ints_beyond_int64(tmp_path):
+    file_path = tmp_path / 'big.json'
+    file_path.write_text('[{"a": 18446744073709551615, "b": 1}, {"a": -1, "b": 2}]')
+
+    df = JSONConnector(file_path).load()
+
+    assert df['a'].tolist() == [18446744073709551615, -1]
+    assert str(df['b'].dtype) == 'int64[pyarrow]'
+
+
+def test_json_connector_non_finite_literals(tmp_path):
+    file_path = tmp_path / 'nan.json'
+    file_path.write_text('{"a": NaN, "b": 1, "c": Infinity}')
+
+    df = JSONConnector(file_path).load()
+
+    assert df.shape == (1, 3)
+    assert pd.isna(df.at[0, 'a'])
+    assert df.at[0, 'c'] == float('inf')
+
+
 def test_jsonl_connector_simple():
     file_path = TEST_DATA_DIR / 'example_1.jsonl'
     conn = JSONConnector(file_path, lines=True)
@@ -60,6 +395,96 @@ def test_jsonl_connector_simple():
     assert df.iloc[0]['color'] == 'Red'
 
 
+def test_jsonl_date_fields_convert_only_through_pandas(tmp_path):
+    file_path = tmp_path / 'dated.jsonl'
+    file_path.write_text(
+        '{"date": "2020-01-02", "zip": "08075"}\n'
+        '{"date": "2020-01-03", "zip": "00123"}\n'
+    )
+
+    streamed = JSONConnector(file_path, lines=True).load()
+    converted = JSONConnector(file_path, lines=True, convert_dates=True).load()
+
+    assert streamed['date'].tolist() == ['2020-01-02', '2020-01-03']
+    assert pd.api.types.is_datetime64_any_dtype(converted['date'])
+    # read_json's default coercion would give [8075, 123]
+    assert streamed['zip'].tolist() == converted['zip'].tolist() == ['08075', '00123']
+
+
+def test_jsonl_ints_beyond_int64(tmp_path):
+    file_path = tmp_path / 'big.jsonl'
+    file_path.write_text('{"a": 18446744073709551615}\n{"a": -1}\n')
+
+    df = JSONConnector(file_path, lines=True).load()
+
+    assert df['a'].tolist() == [18446744073709551615, -1]
+    chunks = list(JSONConnector(file_path, lines=True).load_in_chunks(chunk_size=5))
+    assert chunks[0]['a'].tolist() == [18446744073709551615, -1]
+
+
+def test_jsonl_connector_chunks(tmp_path):
+    file_path = tmp_path / 'rows.jsonl'
+    file_path.write_text(
+        "\n".join(json.dumps({'id': i, 'name': f'n{i}'}) for i in range(5))
+    )
+    conn = JSONConnector(file_path, lines=True)
+
+    chunks = list(conn.load_in_chunks(chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks).equals(conn.load())
+
+
+def test_jsonl_records_spanning_read_blocks(tmp_path, monkeypatch):
+    import connectors.connectors as module
+    file_path = tmp_path / 'long.jsonl'
+    records = [{'id': i, 'text': 'x' * (50 * i)} for i in range(4)]
+    file_path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+    monkeypatch.setattr(module, '_JSONL_READ_SIZE', 7)
+
+    assert list(module._iter_jsonl_records(file_path)) == records
+
+
+
+def test_simdjson_parser_is_per_thread():
+    pytest.importorskip("simdjson")
+    import threading
+    from connectors.connectors import _get_simdjson_parser
+    main = _get_simdjson_parser()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(_get_simdjson_parser()))
+    thread.start()
+    thread.join()
+
+    assert _get_simdjson_parser() is main
+    assert other[0] is not main
+
+
+@pytest.mark.parametrize("pool, env, expected", [
+    (8, {}, 2),                          # startup size: fit to affinity
+    (3, {}, None),                       # already set by the application
+    (8, {'ARROW_NUM_THREADS': '8'}, None),
+])
+def test_arrow_cpu_pool_respects_existing_choice(monkeypatch, pool, env, expected):
+    import connectors
+    pa = pytest.importorskip("pyarrow")
+    if not hasattr(os, "sched_getaffinity"):
+        pytest.skip("no CPU affinity on this platform")
+    calls = []
+    for name in ('ARROW_NUM_THREADS', 'OMP_NUM_THREADS'):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1})
+    monkeypatch.setattr(pa, 'cpu_count', lambda: pool)
+    monkeypatch.setattr(pa, 'set_cpu_count', calls.append)
+
+    connectors._fit_arrow_cpu_pool()
+
+    assert calls == ([] if expected is None else [expected])
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main(["-v", __file__])